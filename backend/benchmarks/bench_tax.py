@@ -0,0 +1,53 @@
+"""
+Jämför bulkberäkning av månadsskatt: gamla float-vägen mot öre-vägen.
+
+    python benchmarks/bench_tax.py [antal_loner] [upprepningar]
+"""
+
+import random
+import sys
+import timeit
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from money import to_ore  # noqa: E402
+from tax import calculate_monthly_tax, calculate_monthly_tax_ore  # noqa: E402
+
+
+def calculate_monthly_tax_float(monthly_salary: Decimal) -> tuple[Decimal, Decimal, Decimal]:
+    """Den tidigare implementationen via float, för jämförelse."""
+    monthly = float(monthly_salary)
+    annual = monthly * 12
+    kommunal = monthly * 0.32
+    statlig_annual = max(0, (annual - 540_000) * 0.20) if annual > 540_000 else 0
+    statlig = statlig_annual / 12
+    total = kommunal + statlig
+    return (
+        Decimal(str(round(kommunal, 2))),
+        Decimal(str(round(statlig, 2))),
+        Decimal(str(round(total, 2))),
+    )
+
+
+def main(antal: int = 10_000, upprepningar: int = 5) -> None:
+    rng = random.Random(0)
+    loner = [Decimal(rng.randint(2_000_000, 10_000_000)).scaleb(-2) for _ in range(antal)]
+    loner_ore = [to_ore(lon) for lon in loner]
+
+    fall = [
+        ("float (tidigare)", lambda: [calculate_monthly_tax_float(lon) for lon in loner]),
+        ("Decimal via öre", lambda: [calculate_monthly_tax(lon) for lon in loner]),
+        ("öre (heltal)", lambda: [calculate_monthly_tax_ore(ore) for ore in loner_ore]),
+    ]
+    print(f"{antal} löner, bästa av {upprepningar} körningar")
+    bas = None
+    for namn, fn in fall:
+        tid = min(timeit.repeat(fn, number=1, repeat=upprepningar))
+        bas = bas or tid
+        print(f"  {namn:<18} {tid * 1000:8.1f} ms  {bas / tid:5.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
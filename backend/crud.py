@@ -1,8 +1,11 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func, extract, insert, text
 from decimal import Decimal
 from datetime import date
-from models import Employee, SalaryRaise, SemesterUttag
+import time
+from models import Employee, SalaryRaise, SemesterUttag, PayrollLine
+from tax import calculate_monthly_tax_ore
+from money import to_ore, from_ore, div_round
 from schemas import EmployeeCreate, EmployeeUpdate, SalaryRaiseCreate, SemesterUttagCreate
 
 
@@ -63,13 +66,15 @@ def create_salary_raise(db: Session, salary_raise: SalaryRaiseCreate):
     if ny_lon <= gammal_lon:
         return None  # Ny lön måste vara högre
     
-    procent_okning = float((ny_lon - gammal_lon) / gammal_lon * 100)
+    # Procent med två decimaler, räknat i hundradels procent
+    gammal_ore = to_ore(gammal_lon)
+    procent_hundradelar = div_round((to_ore(ny_lon) - gammal_ore) * 100 * 100, gammal_ore)
     
     db_salary_raise = SalaryRaise(
         employee_id=salary_raise.employee_id,
         gammal_lon=gammal_lon,
         ny_lon=ny_lon,
-        procent_okning=Decimal(str(round(procent_okning, 2))),
+        procent_okning=Decimal(procent_hundradelar).scaleb(-2),
         orsak=salary_raise.orsak
     )
     db.add(db_salary_raise)
@@ -150,17 +155,111 @@ def get_semester_saldon(db: Session, year: int = None):
 # ============ Månadsrapport ============
 
 def get_manadsrapport(db: Session, year: int, month: int):
-    """Summerar lönekostnad, antal anställda och semesteruttag för en månad."""
-    employees = get_employees(db, limit=1000)
-    total_lon = sum(float(e.lon) for e in employees)
+    """
+    Summerar lönekostnad, antal anställda och semesteruttag för en månad.
+    För stängda månader läses summorna från de frysta löneraderna.
+    """
     semester_uttag = db.query(func.sum(SemesterUttag.antal_dagar)).filter(
         extract("year", SemesterUttag.datum) == year,
         extract("month", SemesterUttag.datum) == month,
     ).scalar() or 0
+    antal, total = db.query(func.count(PayrollLine.id), func.sum(PayrollLine.bruttolon)).filter(
+        PayrollLine.year == year,
+        PayrollLine.month == month,
+    ).one()
+    if antal:
+        return {
+            "year": year,
+            "month": month,
+            "total_lonekostnad": total,
+            "antal_anstallda": antal,
+            "semester_uttag_dagar": int(semester_uttag),
+            "lonekorning_stangd": True,
+        }
+    employees = get_employees(db, limit=1000)
+    total_lon = sum(to_ore(e.lon) for e in employees)
     return {
         "year": year,
         "month": month,
-        "total_lonekostnad": Decimal(str(round(total_lon, 2))),
+        "total_lonekostnad": from_ore(total_lon),
         "antal_anstallda": len(employees),
         "semester_uttag_dagar": int(semester_uttag),
+        "lonekorning_stangd": False,
     }
+
+
+# ============ Lönekörning ============
+
+def close_payroll(db: Session, year: int, month: int):
+    """
+    Stänger en månad: beräknar brutto, skatt och netto för alla anställda
+    i ett svep och fryser resultatet i payroll_lines.
+    Kan köras om; tidigare rader för månaden ersätts.
+    """
+    start = time.perf_counter()
+    if db.get_bind().dialect.name == "postgresql":
+        # Serialisera samtidiga körningar för samma månad; låset släpps vid commit
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": year * 100 + month})
+    rows = []
+    total_brutto = total_skatt = 0
+    employees = db.query(
+        Employee.id, Employee.namn, Employee.personnummer, Employee.avdelning, Employee.lon,
+    ).all()
+    for employee_id, namn, personnummer, avdelning, lon in employees:
+        brutto = to_ore(lon)
+        kommunal, statlig, skatt = calculate_monthly_tax_ore(brutto)
+        rows.append({
+            "employee_id": employee_id,
+            "year": year,
+            "month": month,
+            "namn": namn,
+            "personnummer": personnummer,
+            "avdelning": avdelning,
+            "bruttolon": from_ore(brutto),
+            "kommunalskatt": from_ore(kommunal),
+            "statlig_skatt": from_ore(statlig),
+            "total_skatt": from_ore(skatt),
+            "nettolon": from_ore(brutto - skatt),
+        })
+        total_brutto += brutto
+        total_skatt += skatt
+
+    db.query(PayrollLine).filter(
+        PayrollLine.year == year,
+        PayrollLine.month == month,
+    ).delete(synchronize_session=False)
+    if rows:
+        db.execute(insert(PayrollLine), rows)
+    db.commit()
+
+    return {
+        "year": year,
+        "month": month,
+        "antal_anstallda": len(rows),
+        "total_bruttolon": from_ore(total_brutto),
+        "total_skatt": from_ore(total_skatt),
+        "total_nettolon": from_ore(total_brutto - total_skatt),
+        "tid_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
+
+
+def get_payroll_line(db: Session, employee_id: int, year: int, month: int):
+    return db.query(PayrollLine).filter(
+        PayrollLine.employee_id == employee_id,
+        PayrollLine.year == year,
+        PayrollLine.month == month,
+    ).first()
+
+
+def is_payroll_closed(db: Session, year: int, month: int) -> bool:
+    return db.query(PayrollLine.id).filter(
+        PayrollLine.year == year,
+        PayrollLine.month == month,
+    ).first() is not None
+
+
+def get_payroll_lines(db: Session, year: int, month: int, skip: int = 0, limit: int = 1000):
+    return db.query(PayrollLine).filter(
+        PayrollLine.year == year,
+        PayrollLine.month == month,
+    ).order_by(PayrollLine.employee_id).offset(skip).limit(limit).all()
@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from datetime import date
+from decimal import Decimal
 
 from database import engine, get_db, Base
 from models import Employee, SalaryRaise, SemesterUttag
@@ -11,6 +12,7 @@ from schemas import (
     SalaryRaiseCreate, SalaryRaiseResponse,
     SemesterUttagCreate, SemesterUttagResponse,
     SkatteberakningResponse, ManadsrapportResponse,
+    PayrollLineResponse, LonekorningResponse,
 )
 from crud import (
     get_employee, get_employees, create_employee, update_employee, delete_employee,
@@ -18,9 +20,11 @@ from crud import (
     create_salary_raise, get_salary_raises,
     create_semester_uttag, get_semester_uttag, get_semester_saldon,
     get_manadsrapport,
+    close_payroll, get_payroll_line, get_payroll_lines, is_payroll_closed,
 )
 
-from tax import calculate_monthly_tax
+from tax import calculate_monthly_tax_ore
+from money import to_ore, from_ore
 from pdf_service import generate_payslip_pdf
 
 Base.metadata.create_all(bind=engine)
@@ -127,18 +131,30 @@ def get_payslip_pdf(
     year: int = Query(..., ge=2020, le=2030),
     db: Session = Depends(get_db),
 ):
-    employee = get_employee(db, employee_id)
-    if not employee:
-        raise HTTPException(status_code=404, detail="Anställd hittades inte")
+    # Stängd månad: allt hämtas från den frysta raden, även om den anställda är borttagen
+    line = get_payroll_line(db, employee_id, year, month)
+    if line:
+        source = line
+        lon = line.bruttolon
+        skatt = (line.kommunalskatt, line.statlig_skatt, line.total_skatt)
+    elif is_payroll_closed(db, year, month):
+        raise HTTPException(status_code=404, detail="Anställd ingår inte i lönekörningen för månaden")
+    else:
+        source = get_employee(db, employee_id)
+        if not source:
+            raise HTTPException(status_code=404, detail="Anställd hittades inte")
+        lon = source.lon
+        skatt = None
     pdf_bytes = generate_payslip_pdf(
-        namn=employee.namn,
-        personnummer=employee.personnummer,
-        lon=employee.lon,
-        avdelning=employee.avdelning,
+        namn=source.namn,
+        personnummer=source.personnummer,
+        lon=lon,
+        avdelning=source.avdelning,
         month=month,
         year=year,
+        skatt=skatt,
     )
-    filename = f"lonespec_{employee.namn.replace(' ', '_')}_{year}_{month:02d}.pdf"
+    filename = f"lonespec_{source.namn.replace(' ', '_')}_{year}_{month:02d}.pdf"
     return Response(
         content=pdf_bytes,
         media_type="application/pdf",
@@ -151,28 +167,49 @@ def get_payslip_pdf(
 @app.get("/api/tax/calculate", response_model=SkatteberakningResponse)
 def calculate_tax_endpoint(
     employee_id: int = Query(None),
-    lon: float = Query(None),
+    lon: Decimal = Query(None),
+    year: int = Query(None, ge=2020, le=2030),
+    month: int = Query(None, ge=1, le=12),
     db: Session = Depends(get_db),
 ):
-    """Beräknar skatt. Ange employee_id eller lon (månadslön)."""
+    """
+    Beräknar skatt. Ange employee_id eller lon (månadslön).
+    year och month anges tillsammans och bara med employee_id; för en stängd
+    månad returneras då de frysta beloppen (404 om den anställda inte ingår i
+    lönekörningen), annars beräknas skatten på aktuell lön.
+    """
+    if (year is None) != (month is None):
+        raise HTTPException(status_code=400, detail="Ange både year och month")
+    if year is not None and not employee_id:
+        raise HTTPException(status_code=400, detail="year och month kan bara anges med employee_id")
     if employee_id:
+        if year is not None:
+            line = get_payroll_line(db, employee_id, year, month)
+            if line:
+                return SkatteberakningResponse(
+                    bruttolon=line.bruttolon,
+                    kommunalskatt=line.kommunalskatt,
+                    statlig_skatt=line.statlig_skatt,
+                    total_skatt=line.total_skatt,
+                    nettolon=line.nettolon,
+                )
+            if is_payroll_closed(db, year, month):
+                raise HTTPException(status_code=404, detail="Anställd ingår inte i lönekörningen för månaden")
         employee = get_employee(db, employee_id)
         if not employee:
             raise HTTPException(status_code=404, detail="Anställd hittades inte")
-        bruttolon = employee.lon
+        brutto = to_ore(employee.lon)
     elif lon is not None:
-        from decimal import Decimal
-        bruttolon = Decimal(str(lon))
+        brutto = to_ore(lon)
     else:
         raise HTTPException(status_code=400, detail="Ange employee_id eller lon")
-    kommunal, statlig, total_skatt = calculate_monthly_tax(bruttolon)
-    nettolon = bruttolon - total_skatt
+    kommunal, statlig, total_skatt = calculate_monthly_tax_ore(brutto)
     return SkatteberakningResponse(
-        bruttolon=bruttolon,
-        kommunalskatt=kommunal,
-        statlig_skatt=statlig,
-        total_skatt=total_skatt,
-        nettolon=nettolon,
+        bruttolon=from_ore(brutto),
+        kommunalskatt=from_ore(kommunal),
+        statlig_skatt=from_ore(statlig),
+        total_skatt=from_ore(total_skatt),
+        nettolon=from_ore(brutto - total_skatt),
     )
 
 
@@ -218,3 +255,25 @@ def get_monthly_report(
     db: Session = Depends(get_db),
 ):
     return get_manadsrapport(db, year, month)
+
+
+# ============ Lönekörning ============
+
+@app.post("/api/payroll/close", response_model=LonekorningResponse)
+def close_payroll_month(
+    year: int = Query(..., ge=2020, le=2030),
+    month: int = Query(..., ge=1, le=12),
+    db: Session = Depends(get_db),
+):
+    return close_payroll(db, year, month)
+
+
+@app.get("/api/payroll/lines", response_model=list[PayrollLineResponse])
+def list_payroll_lines(
+    year: int = Query(..., ge=2020, le=2030),
+    month: int = Query(..., ge=1, le=12),
+    skip: int = 0,
+    limit: int = 1000,
+    db: Session = Depends(get_db),
+):
+    return get_payroll_lines(db, year, month, skip=skip, limit=limit)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, Date, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -44,3 +44,29 @@ class SemesterUttag(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     employee = relationship("Employee", back_populates="semester_uttag")
+
+
+class PayrollLine(Base):
+    """
+    Fryst lönerad per anställd och månad, skapad vid lönekörning.
+    employee_id saknar främmande nyckel så att raden överlever att den
+    anställda tas bort; namn, personnummer och avdelning kopieras in.
+    """
+    __tablename__ = "payroll_lines"
+    __table_args__ = (
+        UniqueConstraint("year", "month", "employee_id", name="uq_payroll_lines_period_employee"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    employee_id = Column(Integer, nullable=False, index=True)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    namn = Column(String(100), nullable=False)
+    personnummer = Column(String(12), nullable=False)
+    avdelning = Column(String(100), nullable=False)
+    bruttolon = Column(Numeric(12, 2), nullable=False)
+    kommunalskatt = Column(Numeric(12, 2), nullable=False)
+    statlig_skatt = Column(Numeric(12, 2), nullable=False)
+    total_skatt = Column(Numeric(12, 2), nullable=False)
+    nettolon = Column(Numeric(12, 2), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,48 @@
+"""
+Exakt penningaritmetik i heltal öre.
+- Belopp lagras som int (1 kr = 100 öre)
+- Avrundning: halva öre avrundas bort från noll (ROUND_HALF_UP)
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+ORE_PER_KR = 100
+_CENT = Decimal("0.01")
+
+
+def to_ore(belopp: Decimal | int | str) -> int:
+    """
+    Konverterar kronor till öre, avrundat till närmaste öre.
+    float avvisas eftersom binära flyttal inte är exakta (1.005 -> 100 öre).
+    """
+    if isinstance(belopp, float):
+        raise TypeError("to_ore tar inte float; använd Decimal eller str")
+    d = belopp if isinstance(belopp, Decimal) else Decimal(belopp)
+    return int((d * ORE_PER_KR).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_ore(ore: int) -> Decimal:
+    """Konverterar öre till kronor med två decimaler."""
+    return Decimal(ore).scaleb(-2).quantize(_CENT)
+
+
+def div_round(taljare: int, namnare: int) -> int:
+    """Heltalsdivision avrundad till närmaste heltal, halva bort från noll."""
+    if namnare < 0:
+        taljare, namnare = -taljare, -namnare
+    q, r = divmod(abs(taljare), namnare)
+    if 2 * r >= namnare:
+        q += 1
+    return q if taljare >= 0 else -q
+
+
+def apply_rate(ore: int, taljare: int, namnare: int = 100) -> int:
+    """Beräknar ore * taljare / namnare, avrundat till närmaste öre."""
+    return div_round(ore * taljare, namnare)
+
+
+def format_sek(ore: int) -> str:
+    """Formaterar öre som svenskt belopp, t.ex. 1234567 -> '12 345,67'."""
+    kr, rest = divmod(abs(ore), ORE_PER_KR)
+    tecken = "-" if ore < 0 else ""
+    return f"{tecken}{kr:,}".replace(",", " ") + f",{rest:02d}"
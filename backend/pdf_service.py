@@ -8,7 +8,8 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
-from tax import calculate_monthly_tax
+from tax import calculate_monthly_tax_ore
+from money import to_ore, format_sek
 
 
 def generate_payslip_pdf(
@@ -18,8 +19,13 @@ def generate_payslip_pdf(
     avdelning: str,
     month: int,
     year: int,
+    skatt: tuple[Decimal, Decimal, Decimal] | None = None,
 ) -> bytes:
-    """Genererar lönespec som PDF."""
+    """
+    Genererar lönespec som PDF.
+    skatt = (kommunalskatt, statlig_skatt, total_skatt) från en stängd
+    lönekörning; annars beräknas skatten från lon.
+    """
     buffer = BytesIO()
     doc = SimpleDocTemplate(
         buffer,
@@ -38,9 +44,12 @@ def generate_payslip_pdf(
     )
 
     # Skatteberäkning
-    lon_float = float(lon)
-    kommunal, statlig, total_skatt = calculate_monthly_tax(Decimal(str(lon_float)))
-    nettolon = Decimal(str(round(lon_float - float(total_skatt), 2)))
+    brutto = to_ore(lon)
+    if skatt is None:
+        kommunal, statlig, total_skatt = calculate_monthly_tax_ore(brutto)
+    else:
+        kommunal, statlig, total_skatt = (to_ore(x) for x in skatt)
+    nettolon = brutto - total_skatt
 
     month_names = [
         "", "januari", "februari", "mars", "april", "maj", "juni",
@@ -71,11 +80,11 @@ def generate_payslip_pdf(
     # Löneuppgifter
     salary_data = [
         ["Beskrivning", "Belopp (SEK)"],
-        ["Bruttolön", f"{lon_float:,.2f}".replace(",", " ").replace(".", ",")],
-        ["Kommunalskatt (32%)", f"-{float(kommunal):,.2f}".replace(",", " ").replace(".", ",")],
-        ["Statlig skatt (20% över 540 000 kr/år)", f"-{float(statlig):,.2f}".replace(",", " ").replace(".", ",")],
-        ["Totala avdrag", f"-{float(total_skatt):,.2f}".replace(",", " ").replace(".", ",")],
-        ["Nettolön", f"{float(nettolon):,.2f}".replace(",", " ").replace(".", ",")],
+        ["Bruttolön", format_sek(brutto)],
+        ["Kommunalskatt (32%)", f"-{format_sek(kommunal)}"],
+        ["Statlig skatt (20% över 540 000 kr/år)", f"-{format_sek(statlig)}"],
+        ["Totala avdrag", f"-{format_sek(total_skatt)}"],
+        ["Nettolön", format_sek(nettolon)],
     ]
     salary_table = Table(salary_data, colWidths=[12 * cm, 5 * cm])
     salary_table.setStyle(TableStyle([
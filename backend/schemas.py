@@ -82,6 +82,7 @@ class ManadsrapportResponse(BaseModel):
     total_lonekostnad: Decimal
     antal_anstallda: int
     semester_uttag_dagar: int
+    lonekorning_stangd: bool = False
 
 
 class SkatteberakningResponse(BaseModel):
@@ -90,3 +91,31 @@ class SkatteberakningResponse(BaseModel):
     statlig_skatt: Decimal
     total_skatt: Decimal
     nettolon: Decimal
+
+
+class PayrollLineResponse(BaseModel):
+    employee_id: int
+    year: int
+    month: int
+    namn: str
+    personnummer: str
+    avdelning: str
+    bruttolon: Decimal
+    kommunalskatt: Decimal
+    statlig_skatt: Decimal
+    total_skatt: Decimal
+    nettolon: Decimal
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class LonekorningResponse(BaseModel):
+    year: int
+    month: int
+    antal_anstallda: int
+    total_bruttolon: Decimal
+    total_skatt: Decimal
+    total_nettolon: Decimal
+    tid_ms: float
@@ -2,26 +2,47 @@
 Svensk skatteberäkning.
 - Kommunalskatt: 32% av brutto
 - Statlig skatt: 20% av belopp över 540 000 kr/år (45 000 kr/månad)
+Beräkningen sker i heltal öre (se money.py).
 """
 
 from decimal import Decimal
 
+from money import to_ore, from_ore, apply_rate
+
+KOMMUNALSKATT_PROCENT = 32
+STATLIG_SKATT_PROCENT = 20
+STATLIG_GRANS_ORE = 540_000 * 100
+
+
+def calculate_tax_ore(annual_ore: int) -> tuple[int, int, int]:
+    """
+    Beräknar skatt för årslön i öre.
+    Returnerar (kommunalskatt, statlig_skatt, total_skatt) i öre.
+    """
+    kommunal = apply_rate(annual_ore, KOMMUNALSKATT_PROCENT)
+    statlig = apply_rate(max(0, annual_ore - STATLIG_GRANS_ORE), STATLIG_SKATT_PROCENT)
+    return kommunal, statlig, kommunal + statlig
+
+
+def calculate_monthly_tax_ore(monthly_ore: int) -> tuple[int, int, int]:
+    """
+    Beräknar skatt för månadslön i öre.
+    Statlig skatt räknas på årsbasis och delas på 12 med en enda avrundning.
+    Returnerar (kommunalskatt, statlig_skatt, total_skatt) i öre.
+    """
+    kommunal = apply_rate(monthly_ore, KOMMUNALSKATT_PROCENT)
+    over_grans = max(0, monthly_ore * 12 - STATLIG_GRANS_ORE)
+    statlig = apply_rate(over_grans, STATLIG_SKATT_PROCENT, 100 * 12)
+    return kommunal, statlig, kommunal + statlig
+
 
 def calculate_tax(annual_salary: Decimal) -> tuple[Decimal, Decimal, Decimal]:
     """
     Beräknar skatt för årslön.
     Returnerar (kommunalskatt, statlig_skatt, total_skatt).
     """
-    annual = float(annual_salary)
-    kommunal = annual * 0.32
-    statlig_grans = 540_000
-    statlig = max(0, (annual - statlig_grans) * 0.20) if annual > statlig_grans else 0
-    total = kommunal + statlig
-    return (
-        Decimal(str(round(kommunal, 2))),
-        Decimal(str(round(statlig, 2))),
-        Decimal(str(round(total, 2))),
-    )
+    kommunal, statlig, total = calculate_tax_ore(to_ore(annual_salary))
+    return from_ore(kommunal), from_ore(statlig), from_ore(total)
 
 
 def calculate_monthly_tax(monthly_salary: Decimal) -> tuple[Decimal, Decimal, Decimal]:
@@ -29,14 +50,5 @@ def calculate_monthly_tax(monthly_salary: Decimal) -> tuple[Decimal, Decimal, De
     Beräknar skatt för månaden (månadslön).
     Returnerar (kommunalskatt, statlig_skatt, total_skatt) för månaden.
     """
-    monthly = float(monthly_salary)
-    annual = monthly * 12
-    kommunal = monthly * 0.32
-    statlig_annual = max(0, (annual - 540_000) * 0.20) if annual > 540_000 else 0
-    statlig = statlig_annual / 12
-    total = kommunal + statlig
-    return (
-        Decimal(str(round(kommunal, 2))),
-        Decimal(str(round(statlig, 2))),
-        Decimal(str(round(total, 2))),
-    )
+    kommunal, statlig, total = calculate_monthly_tax_ore(to_ore(monthly_salary))
+    return from_ore(kommunal), from_ore(statlig), from_ore(total)
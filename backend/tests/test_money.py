@@ -0,0 +1,79 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+import pytest
+from hypothesis import given, strategies as st
+
+from money import to_ore, from_ore, div_round, apply_rate, format_sek
+
+ORE = st.integers(min_value=-10**12, max_value=10**12)
+BELOPP = st.decimals(
+    min_value=Decimal("-1e9"), max_value=Decimal("1e9"), places=4,
+    allow_nan=False, allow_infinity=False,
+)
+
+
+def ref_round(d: Decimal) -> int:
+    return int(d.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+@given(BELOPP)
+def test_to_ore_matches_decimal(belopp):
+    assert to_ore(belopp) == ref_round(belopp * 100)
+
+
+@given(BELOPP)
+def test_to_ore_accepts_str(belopp):
+    assert to_ore(str(belopp)) == to_ore(belopp)
+
+
+def test_to_ore_rejects_float():
+    with pytest.raises(TypeError):
+        to_ore(1.005)
+
+
+def test_to_ore_half_rounds_away_from_zero():
+    assert to_ore(Decimal("1.005")) == 101
+    assert to_ore(Decimal("-1.005")) == -101
+    assert to_ore(Decimal("0.004")) == 0
+
+
+@given(ORE)
+def test_from_ore_roundtrip(ore):
+    kr = from_ore(ore)
+    assert kr == Decimal(ore) / 100
+    assert kr.as_tuple().exponent == -2
+    assert to_ore(kr) == ore
+
+
+@given(ORE, st.integers(min_value=-10**6, max_value=10**6).filter(bool))
+def test_div_round_matches_decimal(taljare, namnare):
+    assert div_round(taljare, namnare) == ref_round(Decimal(taljare) / Decimal(namnare))
+
+
+@pytest.mark.parametrize("taljare, namnare, expected", [
+    (5, 2, 3),
+    (-5, 2, -3),
+    (5, -2, -3),
+    (-5, -2, 3),
+    (-7, 3, -2),
+    (-1, 3, 0),
+    (0, -4, 0),
+])
+def test_div_round_signs(taljare, namnare, expected):
+    assert div_round(taljare, namnare) == expected
+
+
+@given(ORE, st.integers(min_value=0, max_value=100), st.integers(min_value=1, max_value=1200))
+def test_apply_rate_matches_decimal(ore, taljare, namnare):
+    assert apply_rate(ore, taljare, namnare) == ref_round(Decimal(ore) * taljare / namnare)
+
+
+@pytest.mark.parametrize("ore, expected", [
+    (0, "0,00"),
+    (5, "0,05"),
+    (-5, "-0,05"),
+    (1234567, "12 345,67"),
+    (100000000, "1 000 000,00"),
+])
+def test_format_sek(ore, expected):
+    assert format_sek(ore) == expected
@@ -0,0 +1,139 @@
+from decimal import Decimal
+
+import pytest
+
+from crud import (
+    create_employee, create_salary_raise, delete_employee,
+    close_payroll, get_payroll_line, get_payroll_lines, get_manadsrapport,
+)
+from models import PayrollLine
+from schemas import EmployeeCreate, SalaryRaiseCreate
+
+YEAR, MONTH = 2025, 3
+
+
+@pytest.fixture
+def employees(db):
+    return [
+        create_employee(db, EmployeeCreate(
+            namn="Anna Andersson", personnummer="199001011234", lon=Decimal("35000.00"), avdelning="IT",
+        )),
+        create_employee(db, EmployeeCreate(
+            namn="Bertil Berg", personnummer="198505055678", lon=Decimal("60000.00"), avdelning="Ekonomi",
+        )),
+    ]
+
+
+def _snapshot(db):
+    return [
+        (l.employee_id, l.namn, l.bruttolon, l.kommunalskatt, l.statlig_skatt, l.total_skatt, l.nettolon)
+        for l in get_payroll_lines(db, YEAR, MONTH)
+    ]
+
+
+def test_close_payroll_computes_lines(db, employees):
+    result = close_payroll(db, YEAR, MONTH)
+    assert result["antal_anstallda"] == 2
+    assert result["total_bruttolon"] == Decimal("95000.00")
+    assert result["total_nettolon"] == result["total_bruttolon"] - result["total_skatt"]
+
+    line = get_payroll_line(db, employees[1].id, YEAR, MONTH)
+    assert line.bruttolon == Decimal("60000.00")
+    assert line.kommunalskatt == Decimal("19200.00")
+    assert line.statlig_skatt == Decimal("3000.00")
+    assert line.nettolon == Decimal("37800.00")
+    assert (line.namn, line.personnummer, line.avdelning) == ("Bertil Berg", "198505055678", "Ekonomi")
+
+
+def test_close_payroll_is_idempotent(db, employees):
+    close_payroll(db, YEAR, MONTH)
+    first = _snapshot(db)
+    close_payroll(db, YEAR, MONTH)
+    assert _snapshot(db) == first
+    assert db.query(PayrollLine).count() == len(employees)
+
+
+def test_close_payroll_rerun_picks_up_new_salary(db, employees):
+    close_payroll(db, YEAR, MONTH)
+    create_salary_raise(db, SalaryRaiseCreate(employee_id=employees[0].id, ny_lon=Decimal("40000.00")))
+    close_payroll(db, YEAR, MONTH)
+    assert get_payroll_line(db, employees[0].id, YEAR, MONTH).bruttolon == Decimal("40000.00")
+    assert db.query(PayrollLine).count() == len(employees)
+
+
+def test_report_open_and_closed(db, employees):
+    report = get_manadsrapport(db, YEAR, MONTH)
+    assert report["lonekorning_stangd"] is False
+    assert report["total_lonekostnad"] == Decimal("95000.00")
+
+    close_payroll(db, YEAR, MONTH)
+    report = get_manadsrapport(db, YEAR, MONTH)
+    assert report["lonekorning_stangd"] is True
+    assert report["antal_anstallda"] == 2
+    assert report["total_lonekostnad"] == Decimal("95000.00")
+    assert get_manadsrapport(db, YEAR, MONTH + 1)["lonekorning_stangd"] is False
+
+
+def test_closed_month_survives_raise_and_deletion(db, employees):
+    anna, bertil = employees
+    close_payroll(db, YEAR, MONTH)
+    create_salary_raise(db, SalaryRaiseCreate(employee_id=anna.id, ny_lon=Decimal("50000.00")))
+    assert delete_employee(db, bertil.id)
+
+    assert get_payroll_line(db, anna.id, YEAR, MONTH).bruttolon == Decimal("35000.00")
+    assert get_payroll_line(db, bertil.id, YEAR, MONTH).bruttolon == Decimal("60000.00")
+    report = get_manadsrapport(db, YEAR, MONTH)
+    assert report["antal_anstallda"] == 2
+    assert report["total_lonekostnad"] == Decimal("95000.00")
+
+
+def test_api_closed_month_reads_frozen_figures(client, db, employees):
+    anna, bertil = employees
+    r = client.post(f"/api/payroll/close?year={YEAR}&month={MONTH}")
+    assert r.status_code == 200
+    assert r.json()["antal_anstallda"] == 2
+
+    create_salary_raise(db, SalaryRaiseCreate(employee_id=anna.id, ny_lon=Decimal("50000.00")))
+    assert delete_employee(db, bertil.id)
+
+    r = client.get(f"/api/tax/calculate?employee_id={anna.id}&year={YEAR}&month={MONTH}")
+    assert r.status_code == 200
+    assert Decimal(r.json()["bruttolon"]) == Decimal("35000.00")
+    assert Decimal(r.json()["nettolon"]) == Decimal("23800.00")
+
+    r = client.get(f"/api/tax/calculate?employee_id={bertil.id}&year={YEAR}&month={MONTH}")
+    assert r.status_code == 200
+    assert Decimal(r.json()["statlig_skatt"]) == Decimal("3000.00")
+
+    r = client.get(f"/api/employees/{bertil.id}/payslip?year={YEAR}&month={MONTH}")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/pdf"
+    assert "Bertil_Berg" in r.headers["content-disposition"]
+
+    r = client.get(f"/api/reports/monthly?year={YEAR}&month={MONTH}")
+    assert r.json()["lonekorning_stangd"] is True
+    assert Decimal(r.json()["total_lonekostnad"]) == Decimal("95000.00")
+
+    r = client.get(f"/api/tax/calculate?employee_id={anna.id}")
+    assert Decimal(r.json()["bruttolon"]) == Decimal("50000.00")
+
+
+def test_api_closed_month_rejects_employee_outside_run(client, db, employees):
+    client.post(f"/api/payroll/close?year={YEAR}&month={MONTH}")
+    cecilia = create_employee(db, EmployeeCreate(
+        namn="Cecilia Ek", personnummer="199509099999", lon=Decimal("30000.00"), avdelning="IT",
+    ))
+    assert client.get(f"/api/employees/{cecilia.id}/payslip?year={YEAR}&month={MONTH}").status_code == 404
+    assert client.get(
+        f"/api/tax/calculate?employee_id={cecilia.id}&year={YEAR}&month={MONTH}"
+    ).status_code == 404
+    assert client.get(f"/api/employees/{cecilia.id}/payslip?year={YEAR}&month={MONTH + 1}").status_code == 200
+
+
+@pytest.mark.parametrize("query", [
+    "employee_id=1&year=2025",
+    "employee_id=1&month=3",
+    "lon=30000&year=2025&month=3",
+])
+def test_api_tax_rejects_partial_period(client, employees, query):
+    assert client.get(f"/api/tax/calculate?{query}").status_code == 400
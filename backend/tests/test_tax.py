@@ -0,0 +1,70 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+import pytest
+from hypothesis import given, strategies as st
+
+from tax import calculate_tax, calculate_monthly_tax
+
+CENT = Decimal("0.01")
+GRANS = Decimal("540000")
+LON = st.integers(min_value=0, max_value=10**10).map(lambda ore: Decimal(ore).scaleb(-2))
+
+
+def ref_tax(annual: Decimal):
+    kommunal = (annual * Decimal("0.32")).quantize(CENT, ROUND_HALF_UP)
+    statlig = (max(Decimal(0), annual - GRANS) * Decimal("0.20")).quantize(CENT, ROUND_HALF_UP)
+    return kommunal, statlig, kommunal + statlig
+
+
+def ref_monthly_tax(monthly: Decimal):
+    kommunal = (monthly * Decimal("0.32")).quantize(CENT, ROUND_HALF_UP)
+    statlig = (max(Decimal(0), monthly * 12 - GRANS) * Decimal("0.20") / 12).quantize(CENT, ROUND_HALF_UP)
+    return kommunal, statlig, kommunal + statlig
+
+
+@given(LON)
+def test_calculate_tax_matches_decimal(annual):
+    assert calculate_tax(annual) == ref_tax(annual)
+
+
+@given(LON)
+def test_calculate_monthly_tax_matches_decimal(monthly):
+    assert calculate_monthly_tax(monthly) == ref_monthly_tax(monthly)
+
+
+@given(LON)
+def test_monthly_tax_parts_add_up(monthly):
+    kommunal, statlig, total = calculate_monthly_tax(monthly)
+    assert kommunal + statlig == total
+
+
+@pytest.mark.parametrize("annual, statlig", [
+    ("539999.99", "0.00"),
+    ("540000.00", "0.00"),
+    ("540000.01", "0.00"),
+    ("540000.03", "0.01"),
+    ("540001.00", "0.20"),
+])
+def test_calculate_tax_statlig_threshold(annual, statlig):
+    assert calculate_tax(Decimal(annual))[1] == Decimal(statlig)
+
+
+@pytest.mark.parametrize("monthly, statlig", [
+    ("44999.99", "0.00"),
+    ("45000.00", "0.00"),
+    ("45000.01", "0.00"),
+    ("45000.03", "0.01"),
+    ("45001.00", "0.20"),
+])
+def test_calculate_monthly_tax_statlig_threshold(monthly, statlig):
+    assert calculate_monthly_tax(Decimal(monthly))[1] == Decimal(statlig)
+
+
+def test_api_tax_normalises_lon_to_ore(client):
+    r = client.get("/api/tax/calculate?lon=1000.005")
+    assert r.status_code == 200
+    data = {k: Decimal(v) for k, v in r.json().items()}
+    assert data["bruttolon"] == Decimal("1000.01")
+    assert data["kommunalskatt"] == Decimal("320.00")
+    assert data["nettolon"] == Decimal("680.01")
+    assert all(v.as_tuple().exponent == -2 for v in data.values())
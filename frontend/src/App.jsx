@@ -151,6 +151,19 @@ function App() {
     }
   }
 
+  const handleClosePayroll = async () => {
+    const stangd = monthlyReport?.lonekorning_stangd
+    if (!confirm(stangd
+      ? 'Månaden är redan stängd. Vill du köra lönekörningen igen med aktuella löner?'
+      : 'Stäng lönekörningen för månaden? Beloppen fryses för lönespec och rapport.')) return
+    try {
+      await api.payroll.close(reportYear, reportMonth)
+      await loadMonthlyReport()
+    } catch (err) {
+      setError(err.message)
+    }
+  }
+
   const handleSemesterUttagSubmit = async (formData) => {
     try {
       await api.semester.uttagCreate(formData)
@@ -477,6 +490,18 @@ function App() {
                     <option key={i} value={i + 1}>{name}</option>
                   ))}
                 </select>
+                {monthlyReport?.lonekorning_stangd && (
+                  <span className="px-3 py-1 text-sm font-medium text-green-700 bg-green-50 rounded-lg">
+                    Stängd
+                  </span>
+                )}
+                <button
+                  onClick={handleClosePayroll}
+                  disabled={reportLoading}
+                  className="px-4 py-2 bg-primary-600 text-white rounded-lg hover:bg-primary-700 font-medium transition-colors disabled:opacity-50"
+                >
+                  {monthlyReport?.lonekorning_stangd ? 'Kör om lönekörning' : 'Stäng lönekörning'}
+                </button>
               </div>
             </div>
             {reportLoading ? (
@@ -70,4 +70,7 @@ export const api = {
   reports: {
     monthly: (year, month) => request(`/reports/monthly?year=${year}&month=${month}`),
   },
+  payroll: {
+    close: (year, month) => request(`/payroll/close?year=${year}&month=${month}`, { method: 'POST' }),
+  },
 };